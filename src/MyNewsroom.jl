@@ -6,7 +6,11 @@ Epistemic programming for neurosymbolic journalism using Dempster-Shafer theory.
 # Exports
 - `BeliefMass`: Core type for belief mass functions
 - `fuse_beliefs`: Combine belief masses using various rules
+- `fuse_multiple`: Combine any number of belief masses
+- `fuse_multiple_batched`: Dempster fusion of many sources on bitmask vectors
+- `compile_fusion`: Dempster's rule specialized for a small fixed frame
 - `calculate_conflict`: Measure conflict between beliefs
+- `is_valid`: Check that a belief mass sums to 1
 - `FusionRule`: Enum of fusion rules (Dempster, Yager, DuboisPrade, Average)
 
 # Example
@@ -25,8 +29,13 @@ result = fuse_beliefs(m1, m2, Dempster)
 module MyNewsroom
 
 export BeliefMass, FusionRule, Dempster, Yager, DuboisPrade, Average
-export fuse_beliefs, calculate_conflict, belief, plausibility
+export fuse_beliefs, fuse_multiple, fuse_multiple_batched, compile_fusion
+export calculate_conflict, belief, plausibility, is_valid
 
 include("dempster_shafer.jl")
 
+function __init__()
+    _WARN_ENABLED[] = get(ENV, "MYNEWSROOM_QUIET", "0") != "1"
+end
+
 end # module
@@ -9,6 +9,75 @@ References:
 # Fusion rules
 @enum FusionRule Dempster Yager DuboisPrade Average
 
+# Bitmask encoding of focal sets.
+#
+# Frames of up to 64 elements are mapped onto the bits of a `UInt64`, so that
+# set intersection, union and disjointness become single integer operations.
+# Larger frames fall back to the `Set`-based implementations.
+
+const MAX_BITMASK_FRAME = 64
+
+"""
+    FrameIndex{T}
+
+Bit positions assigned to the elements of a frame of discernment.
+
+# Fields
+- `elements::Vector{T}`: Element owning bit `i - 1`
+- `bit::Dict{T, UInt64}`: Element → single-bit mask
+- `full::UInt64`: Mask of the whole frame
+"""
+struct FrameIndex{T}
+    elements::Vector{T}
+    bit::Dict{T, UInt64}
+    full::UInt64
+end
+
+"""
+    _frame_index(frame::Set)
+
+Assign each element of `frame` a bit position. Returns `nothing` when the
+frame is too large to be encoded in a `UInt64`.
+"""
+function _frame_index(frame::Set{T}) where T
+    length(frame) > MAX_BITMASK_FRAME && return nothing
+    elements = collect(frame)
+    bit = Dict{T, UInt64}(e => one(UInt64) << (i - 1) for (i, e) in enumerate(elements))
+    full = length(elements) == 64 ? typemax(UInt64) : (one(UInt64) << length(elements)) - 1
+    FrameIndex{T}(elements, bit, full)
+end
+
+"""
+    _encode(index::FrameIndex, s::Set)
+
+Encode a set as a bitmask. Elements outside the frame are ignored, which
+leaves subset and disjointness tests against focal sets unchanged.
+"""
+function _encode(index::FrameIndex{T}, s::Set{T}) where T
+    mask = zero(UInt64)
+    for e in s
+        mask |= get(index.bit, e, zero(UInt64))
+    end
+    mask
+end
+
+"""
+    _decode(index::FrameIndex, mask::UInt64)
+
+Decode a bitmask back into a set of frame elements.
+"""
+function _decode(index::FrameIndex{T}, mask::UInt64) where T
+    s = Set{T}()
+    while !iszero(mask)
+        push!(s, index.elements[trailing_zeros(mask) + 1])
+        mask &= mask - one(UInt64)
+    end
+    s
+end
+
+# Marker selecting the unvalidated constructor used for fusion results
+struct _Trusted end
+
 """
     BeliefMass{T}
 
@@ -18,6 +87,9 @@ Belief mass function over a frame of discernment Θ.
 - `masses::Dict{Set{T}, Float64}`: Focal sets → probability masses
 - `frame::Set{T}`: Frame of discernment (universe)
 - `ε::Float64`: Tolerance for floating-point comparisons
+- `index`: Bit positions of the frame elements (`nothing` for frames over 64 elements)
+- `bits::Vector{UInt64}`: Focal-set bitmasks in ascending order (empty for frames over 64 elements)
+- `mass::Vector{Float64}`: Mass of each entry of `bits`
 
 # Example
 ```julia
@@ -29,6 +101,9 @@ struct BeliefMass{T}
     masses::Dict{Set{T}, Float64}
     frame::Set{T}
     ε::Float64
+    index::Union{FrameIndex{T}, Nothing}
+    bits::Vector{UInt64}
+    mass::Vector{Float64}
 
     function BeliefMass{T}(masses::Dict{Set{T}, Float64},
                            frame::Union{Set{T}, Nothing}=nothing;
@@ -42,31 +117,197 @@ struct BeliefMass{T}
             frame
         end
 
-        # Validate masses
-        for (focal_set, mass) in masses
-            !(0.0 ≤ mass ≤ 1.0 + ε) && error("Mass $mass out of range [0,1]")
-            !issubset(focal_set, actual_frame) && error("Focal set not in frame")
+        # Validate and build the structure-of-arrays view used by the
+        # bitmask kernels in a single pass. An inferred frame contains every
+        # focal set by construction; otherwise a focal set lies in the frame
+        # iff each of its elements was assigned a bit.
+        check_frame = frame !== nothing
+        index = _frame_index(actual_frame)
+        bits = UInt64[]
+        mass = Float64[]
+        if index !== nothing
+            sizehint!(bits, length(masses))
+            sizehint!(mass, length(masses))
+        end
+
+        for (focal_set, m) in masses
+            !(0.0 ≤ m ≤ 1.0 + ε) && error("Mass $m out of range [0,1]")
+            if index !== nothing
+                b = _encode(index, focal_set)
+                check_frame && count_ones(b) != length(focal_set) && error("Focal set not in frame")
+                push!(bits, b)
+                push!(mass, m)
+            elseif check_frame
+                !issubset(focal_set, actual_frame) && error("Focal set not in frame")
+            end
         end
 
-        # Check sum
-        total = sum(values(masses))
+        # Check sum (pairwise summation over the mass vector when available)
+        total = index === nothing ? sum(values(masses)) : sum(mass)
         !isapprox(total, 1.0, atol=ε) && error("Masses sum to $total, must sum to 1.0")
 
         # Normalize if close to 1.0
         normalized_masses = if abs(total - 1.0) < ε && total != 1.0
+            mass ./= total
             Dict(k => v/total for (k,v) in masses)
         else
             masses
         end
 
-        new{T}(normalized_masses, actual_frame, ε)
+        # Keep the bitmasks sorted so that kernels can merge them linearly
+        if !issorted(bits)
+            order = sortperm(bits)
+            bits = bits[order]
+            mass = mass[order]
+        end
+
+        new{T}(normalized_masses, actual_frame, ε, index, bits, mass)
     end
+
+    # Fusion results: built from validated inputs, so validation is skipped
+    BeliefMass{T}(::_Trusted, masses::Dict{Set{T}, Float64}, frame::Set{T}, ε::Float64,
+                  index::Union{FrameIndex{T}, Nothing}, bits::Vector{UInt64},
+                  mass::Vector{Float64}) where T =
+        new{T}(masses, frame, ε, index, bits, mass)
 end
 
 # Constructor convenience
 BeliefMass(masses::Dict{Set{T}, Float64}, args...; kwargs...) where T =
     BeliefMass{T}(masses, args...; kwargs...)
 
+"""
+    _soa_in(index::FrameIndex, m::BeliefMass)
+
+Focal-set bitmask and mass vectors of `m` expressed over `index`, in
+ascending bitmask order. Equal frames built separately may enumerate their
+elements in a different order, in which case the focal sets are re-encoded
+and re-sorted.
+"""
+function _soa_in(index::FrameIndex{T}, m::BeliefMass{T}) where T
+    (m.index === index || m.index.elements == index.elements) && return m.bits, m.mass
+
+    bits = UInt64[_encode(index, _decode(m.index, b)) for b in m.bits]
+    order = sortperm(bits)
+    bits[order], m.mass[order]
+end
+
+"""
+    _aligned_bits(m1::BeliefMass, m2::BeliefMass)
+
+Parallel bitmask and mass vectors of `m1` and `m2`, both over the frame
+index of `m1` and in ascending bitmask order.
+"""
+function _aligned_bits(m1::BeliefMass{T}, m2::BeliefMass{T}) where T
+    m1.frame != m2.frame && error("Incompatible frames")
+    m1.bits, m1.mass, _soa_in(m1.index, m2)...
+end
+
+"""
+    _unchecked(m::BeliefMass, masses::Dict, bits=UInt64[], mass=Float64[])
+
+Wrap the output of a fusion rule over the frame of `m` without validating
+it again. Unlike the public constructor this does not renormalize a total
+within ε of 1, so callers must pass masses that already sum to 1. The
+result shares the frame index of `m`.
+"""
+_unchecked(m::BeliefMass{T}, masses::Dict{Set{T}, Float64},
+           bits::Vector{UInt64}=UInt64[], mass::Vector{Float64}=Float64[]) where T =
+    BeliefMass{T}(_Trusted(), masses, m.frame, m.ε, m.index, bits, mass)
+
+"""
+    _from_bitmasses(m::BeliefMass, focal::Vector, combined::Vector)
+
+Build a fusion result over the frame of `m` from parallel focal-set bitmask
+and mass vectors.
+"""
+function _from_bitmasses(m::BeliefMass{T}, focal::Vector{UInt64},
+                         combined::Vector{Float64}) where T
+    masses = Dict{Set{T}, Float64}()
+    sizehint!(masses, length(focal))
+    for (k, v) in zip(focal, combined)
+        masses[_decode(m.index, k)] = v
+    end
+    _unchecked(m, masses, focal, combined)
+end
+
+"""
+    _groupsum(keys::Vector{UInt64}, vals::Vector)
+
+Sum `vals` per distinct key. Returns the distinct keys in ascending order
+with their totals.
+"""
+function _groupsum(keys::Vector{UInt64}, vals::Vector{R}) where R<:AbstractFloat
+    out_keys = UInt64[]
+    out_vals = R[]
+    @inbounds for i in sortperm(keys)
+        if !isempty(out_keys) && out_keys[end] == keys[i]
+            out_vals[end] += vals[i]
+        else
+            push!(out_keys, keys[i])
+            push!(out_vals, vals[i])
+        end
+    end
+    out_keys, out_vals
+end
+
+"""
+    _pairwise(target, bits_a, mass_a, bits_b, mass_b)
+
+Outer-product kernel: for every pair of focal sets `(a, b)`, the key
+`target(a, b)` and the product of their masses, written in a single pass
+into flat preallocated vectors. Specialized on `target` and on the mass
+precision `R`.
+"""
+function _pairwise(target::F, bits_a::Vector{UInt64}, mass_a::Vector{R},
+                   bits_b::Vector{UInt64}, mass_b::Vector{R}) where {F, R<:AbstractFloat}
+    n, m = length(bits_a), length(bits_b)
+    out_bits = Vector{UInt64}(undef, n * m)
+    out_mass = Vector{R}(undef, n * m)
+    @inbounds for i in 1:n
+        a, ma = bits_a[i], mass_a[i]
+        offset = (i - 1) * m
+        @simd for j in 1:m
+            out_bits[offset + j] = target(a, bits_b[j])
+            out_mass[offset + j] = ma * mass_b[j]
+        end
+    end
+    out_bits, out_mass
+end
+
+"""
+    _conjunctive(bits_a, mass_a, bits_b, mass_b)
+
+Conjunctive combination of two bitmask-encoded mass functions: the outer
+product of the masses, grouped by the intersection of the focal sets.
+Any mass on key `0` (the empty set) is the conflict K.
+"""
+_conjunctive(bits_a::Vector{UInt64}, mass_a::Vector{R},
+             bits_b::Vector{UInt64}, mass_b::Vector{R}) where R<:AbstractFloat =
+    _groupsum(_pairwise(&, bits_a, mass_a, bits_b, mass_b)...)
+
+"""
+    _disjoint_unions(bits_a, mass_a, bits_b, mass_b)
+
+Unions and mass products of the disjoint pairs of focal sets only: the
+conflicting pairs that Dubois-Prade reassigns.
+"""
+function _disjoint_unions(bits_a::Vector{UInt64}, mass_a::Vector{Float64},
+                          bits_b::Vector{UInt64}, mass_b::Vector{Float64})
+    out_bits = UInt64[]
+    out_mass = Float64[]
+    @inbounds for i in eachindex(bits_a, mass_a)
+        a, ma = bits_a[i], mass_a[i]
+        for j in eachindex(bits_b, mass_b)
+            b = bits_b[j]
+            if iszero(a & b)
+                push!(out_bits, a | b)
+                push!(out_mass, ma * mass_b[j])
+            end
+        end
+    end
+    out_bits, out_mass
+end
+
 """
     is_valid(m::BeliefMass)
 
@@ -81,7 +322,16 @@ Calculate belief (lower probability) in a proposition.
 Bel(A) = Σ m(B) for all B ⊆ A
 """
 function belief(m::BeliefMass{T}, proposition::Set{T}) where T
-    sum(mass for (focal_set, mass) in m.masses if issubset(focal_set, proposition))
+    if m.index !== nothing
+        p = _encode(m.index, proposition)
+        total = 0.0
+        @inbounds @simd for i in eachindex(m.bits, m.mass)
+            total += ifelse(iszero(m.bits[i] & ~p), m.mass[i], 0.0)
+        end
+        return total
+    end
+
+    sum((mass for (focal_set, mass) in m.masses if issubset(focal_set, proposition)); init=0.0)
 end
 
 """
@@ -91,7 +341,76 @@ Calculate plausibility (upper probability) in a proposition.
 Pl(A) = Σ m(B) for all B ∩ A ≠ ∅
 """
 function plausibility(m::BeliefMass{T}, proposition::Set{T}) where T
-    sum(mass for (focal_set, mass) in m.masses if !isdisjoint(focal_set, proposition))
+    if m.index !== nothing
+        p = _encode(m.index, proposition)
+        total = 0.0
+        @inbounds @simd for i in eachindex(m.bits, m.mass)
+            total += ifelse(iszero(m.bits[i] & p), 0.0, m.mass[i])
+        end
+        return total
+    end
+
+    sum((mass for (focal_set, mass) in m.masses if !isdisjoint(focal_set, proposition)); init=0.0)
+end
+
+"""
+    belief(m::BeliefMass, propositions::AbstractVector{<:Set})
+
+Belief in each of `propositions`, computed in a single pass over the focal
+sets of `m`.
+"""
+function belief(m::BeliefMass{T}, propositions::AbstractVector{<:Set}) where T
+    m.index === nothing && return Float64[belief(m, p) for p in propositions]
+
+    props = UInt64[_encode(m.index, p) for p in propositions]
+    result = zeros(length(props))
+    @inbounds for i in eachindex(m.bits, m.mass)
+        b, mass = m.bits[i], m.mass[i]
+        @simd for j in eachindex(result, props)
+            result[j] += ifelse(iszero(b & ~props[j]), mass, 0.0)
+        end
+    end
+    result
+end
+
+"""
+    plausibility(m::BeliefMass, propositions::AbstractVector{<:Set})
+
+Plausibility of each of `propositions`, computed in a single pass over the
+focal sets of `m`.
+"""
+function plausibility(m::BeliefMass{T}, propositions::AbstractVector{<:Set}) where T
+    m.index === nothing && return Float64[plausibility(m, p) for p in propositions]
+
+    props = UInt64[_encode(m.index, p) for p in propositions]
+    result = zeros(length(props))
+    @inbounds for i in eachindex(m.bits, m.mass)
+        b, mass = m.bits[i], m.mass[i]
+        @simd for j in eachindex(result, props)
+            result[j] += ifelse(iszero(b & props[j]), 0.0, mass)
+        end
+    end
+    result
+end
+
+"""
+    _conflict_bits(bits_a, mass_a, bits_b, mass_b)
+
+Conflict kernel over bitmask-encoded focal sets: the inner loop is branch-free
+so it can be vectorized.
+"""
+function _conflict_bits(bits_a::Vector{UInt64}, mass_a::Vector{Float64},
+                        bits_b::Vector{UInt64}, mass_b::Vector{Float64})
+    conflict = 0.0
+    @inbounds for i in eachindex(bits_a, mass_a)
+        a = bits_a[i]
+        disjoint_mass = 0.0
+        @simd for j in eachindex(bits_b, mass_b)
+            disjoint_mass += ifelse(iszero(a & bits_b[j]), mass_b[j], 0.0)
+        end
+        conflict += mass_a[i] * disjoint_mass
+    end
+    conflict
 end
 
 """
@@ -103,6 +422,8 @@ K = Σ m₁(A) · m₂(B) for all A ∩ B = ∅
 function calculate_conflict(m1::BeliefMass{T}, m2::BeliefMass{T}) where T
     m1.frame != m2.frame && error("Incompatible frames")
 
+    m1.index !== nothing && return _conflict_bits(_aligned_bits(m1, m2)...)
+
     conflict = 0.0
     for (set_a, mass_a) in m1.masses
         for (set_b, mass_b) in m2.masses
@@ -114,36 +435,144 @@ function calculate_conflict(m1::BeliefMass{T}, m2::BeliefMass{T}) where T
     conflict
 end
 
+"""
+    _is_vacuous(m::BeliefMass)
+
+Whether `m` puts all of its mass on the frame (total ignorance).
+"""
+_is_vacuous(m::BeliefMass) = length(m.masses) == 1 && haskey(m.masses, m.frame)
+
+"""
+    _has_empty_focal(m::BeliefMass)
+
+Whether `m` puts mass (possibly zero) on the empty set, as the open-world
+TBM allows.
+"""
+_has_empty_focal(m::BeliefMass{T}) where T = haskey(m.masses, Set{T}())
+
+"""
+    _vacuous_operand(m1::BeliefMass, m2::BeliefMass)
+
+The vacuous mass function is the identity of the Dempster, Yager and
+Dubois-Prade rules on mass functions without an empty focal set: if either
+operand is vacuous and the other has none, return the other one, otherwise
+`nothing`. Mass on the empty set is conflict, which each rule reassigns.
+"""
+function _vacuous_operand(m1::BeliefMass{T}, m2::BeliefMass{T}) where T
+    m1.frame == m2.frame || return nothing
+
+    if _is_vacuous(m1)
+        _has_empty_focal(m2) || return m2
+    elseif _is_vacuous(m2)
+        _has_empty_focal(m1) || return m1
+    end
+    nothing
+end
+
+# High-conflict warnings are on by default; setting MYNEWSROOM_QUIET=1
+# disables them (read in `MyNewsroom.__init__`)
+const _WARN_ENABLED = Ref(true)
+
+# Conflict level (rounded to 0.01) of the last high-conflict warning; atomic
+# because parallel tree levels check conflict from several tasks
+const _LAST_CONFLICT_LEVEL = Threads.Atomic{Float64}(NaN)
+
+"""
+    _check_dempster_conflict(conflict::Float64, ε::Float64)
+
+Reject total conflict and warn on high conflict before normalizing by (1 - K).
+Consecutive warnings at the same conflict level (rounded to 0.01) are logged
+once, so long fusion loops over similar sources do not repeatedly pay for
+formatting and dispatching them; a new level warns again.
+"""
+function _check_dempster_conflict(conflict::Float64, ε::Float64)
+    conflict >= 1.0 - ε && error("Total conflict (K=$conflict). Cannot use Dempster's rule.")
+
+    if _WARN_ENABLED[] && conflict >= 0.9
+        level = round(conflict, digits=2)
+        if Threads.atomic_xchg!(_LAST_CONFLICT_LEVEL, level) != level
+            @warn "High conflict (K=$conflict). Result may be unreliable."
+        end
+    end
+end
+
+"""
+    _take_conflict!(focal, combined)
+
+Remove the mass assigned to the empty set from sorted combination output and
+return it.
+"""
+function _take_conflict!(focal::Vector{UInt64}, combined::Vector{<:AbstractFloat})
+    if !isempty(focal) && iszero(focal[1])
+        popfirst!(focal)
+        return Float64(popfirst!(combined))
+    end
+    0.0
+end
+
 """
     fuse_dempster(m1::BeliefMass, m2::BeliefMass)
 
 Dempster's rule: normalize by (1 - K).
 """
 function fuse_dempster(m1::BeliefMass{T}, m2::BeliefMass{T}) where T
-    conflict = calculate_conflict(m1, m2)
+    shortcut = _vacuous_operand(m1, m2)
+    shortcut !== nothing && return shortcut
 
-    conflict >= 1.0 - m1.ε && error("Total conflict (K=$conflict). Cannot use Dempster's rule.")
+    m1.index === nothing && return _fuse_dempster_sets(m1, m2)
 
-    if conflict >= 0.9
-        @warn "High conflict (K=$conflict). Result may be unreliable."
-    end
+    focal, combined = _conjunctive(_aligned_bits(m1, m2)...)
+    conflict = _take_conflict!(focal, combined)
+    _check_dempster_conflict(conflict, m1.ε)
+
+    combined ./= 1.0 - conflict
+    _from_bitmasses(m1, focal, combined)
+end
+
+# Accumulator for the Set-based combination loops: each key maps to a mutable
+# cell, so `_accumulate!` hashes the focal set once per update instead of
+# twice for `d[k] = get(d, k, 0.0) + v`.
+const _MassAccumulator{K} = Dict{K, Base.RefValue{Float64}}
+
+_accumulate!(acc::_MassAccumulator, k, v::Float64) = (get!(() -> Ref(0.0), acc, k)[] += v)
+
+_masses(acc::_MassAccumulator{K}) where K = Dict{K, Float64}(k => r[] for (k, r) in acc)
+
+"""
+    _conjunctive_sets(m1::BeliefMass, m2::BeliefMass)
+
+Set-based conjunctive combination. Returns the masses on non-empty
+intersections together with the conflict K, accumulated in the same pass.
+"""
+function _conjunctive_sets(m1::BeliefMass{T}, m2::BeliefMass{T}) where T
+    m1.frame != m2.frame && error("Incompatible frames")
 
-    # Conjunctive combination
-    combined = Dict{Set{T}, Float64}()
+    combined = _MassAccumulator{Set{T}}()
+    conflict = 0.0
     for (set_a, mass_a) in m1.masses
         for (set_b, mass_b) in m2.masses
+            product = mass_a * mass_b
             intersection = set_a ∩ set_b
-            if !isempty(intersection)
-                combined[intersection] = get(combined, intersection, 0.0) + mass_a * mass_b
+            if isempty(intersection)
+                conflict += product
+            else
+                _accumulate!(combined, intersection, product)
             end
         end
     end
+    _masses(combined), conflict
+end
+
+"""Set-based [`fuse_dempster`](@ref) for frames too large for bitmasks."""
+function _fuse_dempster_sets(m1::BeliefMass{T}, m2::BeliefMass{T}) where T
+    combined, conflict = _conjunctive_sets(m1, m2)
+    _check_dempster_conflict(conflict, m1.ε)
 
     # Normalize
     normalization = 1.0 - conflict
     normalized = Dict(k => v/normalization for (k,v) in combined)
 
-    BeliefMass(normalized, m1.frame)
+    _unchecked(m1, normalized)
 end
 
 """
@@ -152,24 +581,45 @@ end
 Yager's rule: assign conflict to ignorance (frame).
 """
 function fuse_yager(m1::BeliefMass{T}, m2::BeliefMass{T}) where T
-    conflict = calculate_conflict(m1, m2)
+    shortcut = _vacuous_operand(m1, m2)
+    shortcut !== nothing && return shortcut
 
-    combined = Dict{Set{T}, Float64}()
-    for (set_a, mass_a) in m1.masses
-        for (set_b, mass_b) in m2.masses
-            intersection = set_a ∩ set_b
-            if !isempty(intersection)
-                combined[intersection] = get(combined, intersection, 0.0) + mass_a * mass_b
-            end
+    m1.index === nothing && return _fuse_yager_sets(m1, m2)
+
+    focal, combined = _conjunctive(_aligned_bits(m1, m2)...)
+    conflict = _take_conflict!(focal, combined)
+
+    # Add conflict to frame (the largest possible key); negligible conflict
+    # is dropped and the remaining masses renormalized
+    if conflict > m1.ε
+        full = m1.index.full
+        if !isempty(focal) && focal[end] == full
+            combined[end] += conflict
+        else
+            push!(focal, full)
+            push!(combined, conflict)
         end
+    elseif conflict > 0.0
+        combined ./= sum(combined)
     end
 
-    # Add conflict to frame
+    _from_bitmasses(m1, focal, combined)
+end
+
+"""Set-based [`fuse_yager`](@ref) for frames too large for bitmasks."""
+function _fuse_yager_sets(m1::BeliefMass{T}, m2::BeliefMass{T}) where T
+    combined, conflict = _conjunctive_sets(m1, m2)
+
+    # Add conflict to frame; negligible conflict is dropped and the
+    # remaining masses renormalized
     if conflict > m1.ε
         combined[m1.frame] = get(combined, m1.frame, 0.0) + conflict
+    elseif conflict > 0.0
+        total = sum(values(combined))
+        map!(v -> v / total, values(combined))
     end
 
-    BeliefMass(combined, m1.frame)
+    _unchecked(m1, combined)
 end
 
 """
@@ -178,7 +628,30 @@ end
 Dubois-Prade rule: redistribute conflict to union.
 """
 function fuse_dubois_prade(m1::BeliefMass{T}, m2::BeliefMass{T}) where T
-    combined = Dict{Set{T}, Float64}()
+    shortcut = _vacuous_operand(m1, m2)
+    shortcut !== nothing && return shortcut
+
+    m1.index === nothing && return _fuse_dubois_prade_sets(m1, m2)
+
+    bits_a, mass_a, bits_b, mass_b = _aligned_bits(m1, m2)
+    focal, combined = _conjunctive(bits_a, mass_a, bits_b, mass_b)
+
+    # Conflict: assign each disjoint pair to its union, grouped by union
+    # before merging with the intersections. Key 0 is present whenever some
+    # pair is disjoint, even if all such pairs have zero mass.
+    has_disjoint = !isempty(focal) && iszero(focal[1])
+    _take_conflict!(focal, combined)
+    if has_disjoint
+        unions, union_mass = _groupsum(_disjoint_unions(bits_a, mass_a, bits_b, mass_b)...)
+        focal, combined = _groupsum(vcat(focal, unions), vcat(combined, union_mass))
+    end
+
+    _from_bitmasses(m1, focal, combined)
+end
+
+"""Set-based [`fuse_dubois_prade`](@ref) for frames too large for bitmasks."""
+function _fuse_dubois_prade_sets(m1::BeliefMass{T}, m2::BeliefMass{T}) where T
+    combined = _MassAccumulator{Set{T}}()
 
     for (set_a, mass_a) in m1.masses
         for (set_b, mass_b) in m2.masses
@@ -186,16 +659,45 @@ function fuse_dubois_prade(m1::BeliefMass{T}, m2::BeliefMass{T}) where T
             intersection = set_a ∩ set_b
 
             if !isempty(intersection)
-                combined[intersection] = get(combined, intersection, 0.0) + product
+                _accumulate!(combined, intersection, product)
             else
                 # Conflict: assign to union
-                union_set = set_a ∪ set_b
-                combined[union_set] = get(combined, union_set, 0.0) + product
+                _accumulate!(combined, set_a ∪ set_b, product)
             end
         end
     end
 
-    BeliefMass(combined, m1.frame)
+    _unchecked(m1, _masses(combined))
+end
+
+"""
+    _merge_average(bits_a, mass_a, bits_b, mass_b)
+
+Average two mass functions given as ascending bitmask vectors, with a
+linear two-pointer merge; the output is again in ascending order.
+"""
+function _merge_average(bits_a::Vector{UInt64}, mass_a::Vector{Float64},
+                        bits_b::Vector{UInt64}, mass_b::Vector{Float64})
+    out_bits = sizehint!(UInt64[], length(bits_a) + length(bits_b))
+    out_mass = sizehint!(Float64[], length(bits_a) + length(bits_b))
+    i, j = 1, 1
+    @inbounds while i <= length(bits_a) || j <= length(bits_b)
+        if j > length(bits_b) || (i <= length(bits_a) && bits_a[i] < bits_b[j])
+            push!(out_bits, bits_a[i])
+            push!(out_mass, mass_a[i] * 0.5)
+            i += 1
+        elseif i > length(bits_a) || bits_b[j] < bits_a[i]
+            push!(out_bits, bits_b[j])
+            push!(out_mass, mass_b[j] * 0.5)
+            j += 1
+        else
+            push!(out_bits, bits_a[i])
+            push!(out_mass, (mass_a[i] + mass_b[j]) * 0.5)
+            i += 1
+            j += 1
+        end
+    end
+    out_bits, out_mass
 end
 
 """
@@ -204,16 +706,106 @@ end
 Simple averaging (not proper Dempster-Shafer, but useful baseline).
 """
 function fuse_average(m1::BeliefMass{T}, m2::BeliefMass{T}) where T
-    all_sets = union(keys(m1.masses), keys(m2.masses))
-    averaged = Dict{Set{T}, Float64}()
+    if m1.index !== nothing
+        focal, averaged = _merge_average(_aligned_bits(m1, m2)...)
+        return _from_bitmasses(m1, focal, averaged)
+    end
+
+    m1.frame != m2.frame && error("Incompatible frames")
+
+    averaged = mergewith(+, m1.masses, m2.masses)
+    map!(v -> v * 0.5, values(averaged))
+    _unchecked(m1, averaged)
+end
 
-    for focal_set in all_sets
-        mass_a = get(m1.masses, focal_set, 0.0)
-        mass_b = get(m2.masses, focal_set, 0.0)
-        averaged[focal_set] = (mass_a + mass_b) / 2.0
+# Largest frame for which `compile_fusion` unrolls the full subset table
+const MAX_COMPILED_FRAME = 4
+
+"""
+    _fuse_dense(a::NTuple{S, Float64}, b::NTuple{S, Float64})
+
+Unrolled conjunctive combination of two dense mass vectors indexed by
+focal-set bitmask + 1, over a frame with `S = 2^n` subsets. Generated as one
+straight-line sum per target subset, with no loops or lookups; entry 1 holds
+the conflict.
+"""
+@generated function _fuse_dense(a::NTuple{S, Float64}, b::NTuple{S, Float64}) where S
+    terms = [Expr[] for _ in 1:S]
+    for i in 0:S-1, j in 0:S-1
+        push!(terms[(i & j) + 1], :(a[$(i + 1)] * b[$(j + 1)]))
+    end
+    :(tuple($((Expr(:call, :+, t...) for t in terms)...)))
+end
+
+"""
+    _dense(::Val{S}, bits::Vector{UInt64}, mass::Vector{Float64})
+
+Scatter a mass function with ascending, distinct bitmasks into a dense
+`S`-tuple indexed by bitmask + 1, without allocating.
+"""
+function _dense(::Val{S}, bits::Vector{UInt64}, mass::Vector{Float64}) where S
+    ntuple(Val(S)) do i
+        k = searchsortedfirst(bits, UInt64(i - 1))
+        k <= length(bits) && bits[k] == i - 1 ? mass[k] : 0.0
     end
+end
+
+"""
+    _reached(bits1::Vector{UInt64}, bits2::Vector{UInt64})
 
-    BeliefMass(averaged, m1.frame)
+Bitset of the subsets reached by intersecting a focal set of each operand,
+including intersections whose product is zero, so compiled fusion keeps the
+same focal sets as [`fuse_dempster`](@ref).
+"""
+function _reached(bits1::Vector{UInt64}, bits2::Vector{UInt64})
+    reached = zero(UInt64)
+    for a in bits1, b in bits2
+        reached |= one(UInt64) << (a & b)
+    end
+    reached
+end
+
+"""
+    compile_fusion(frame::Set)
+
+Specialize Dempster's rule for a small, fixed frame of discernment (up to
+$MAX_COMPILED_FRAME elements). Returns a function `(m1, m2) -> BeliefMass`
+that combines dense mass tables with a fully unrolled kernel generated for
+the frame's subset count; Julia compiles it once per frame size and reuses
+it for every later call.
+
+# Example
+```julia
+θ = Set(["true", "false"])
+fuse = compile_fusion(θ)
+result = fuse(m1, m2)
+```
+"""
+function compile_fusion(frame::Set{T}) where T
+    n = length(frame)
+    n > MAX_COMPILED_FRAME && error("Frame has $n elements, compile_fusion supports at most $MAX_COMPILED_FRAME")
+    subsets = Val(1 << n)
+
+    function fuse(m1::BeliefMass{T}, m2::BeliefMass{T})
+        (m1.frame == frame && m2.frame == frame) || error("Incompatible frames")
+
+        bits2, mass2 = _soa_in(m1.index, m2)
+        combined = _fuse_dense(_dense(subsets, m1.bits, m1.mass),
+                               _dense(subsets, bits2, mass2))
+        conflict = combined[1]
+        _check_dempster_conflict(conflict, m1.ε)
+
+        reached = _reached(m1.bits, bits2)
+        focal = UInt64[]
+        masses = Float64[]
+        for k in 2:length(combined)
+            if isodd(reached >> (k - 1))
+                push!(focal, UInt64(k - 1))
+                push!(masses, combined[k] / (1.0 - conflict))
+            end
+        end
+        _from_bitmasses(m1, focal, masses)
+    end
 end
 
 """
@@ -243,15 +835,140 @@ function fuse_beliefs(m1::BeliefMass{T}, m2::BeliefMass{T},
     end
 end
 
+"""
+    _fuse_pairwise(masses::Vector{BeliefMass}, rule::FusionRule)
+
+Reduce `masses` as a balanced binary tree of pairwise fusions, so that no
+intermediate result is fused with every remaining source in turn. Only
+valid for associative rules.
+"""
+function _fuse_pairwise(masses::Vector{BeliefMass{T}}, rule::FusionRule) where T
+    level = masses
+    while length(level) > 1
+        level = _fuse_level(level, rule)
+    end
+    level[1]
+end
+
+# Smallest tree level worth spreading over threads. Spawning and scheduling a
+# task costs a few microseconds, about as much as fusing two sources with a
+# handful of focal sets, so only levels of many pairs gain from threads.
+const PARALLEL_LEVEL_SIZE = 64
+
+"""
+    _fuse_level(level::Vector{BeliefMass}, rule::FusionRule; parallel)
+
+Fuse adjacent pairs of one tree level; an odd last element is carried over.
+The pairs are independent, so by default levels of at least
+`PARALLEL_LEVEL_SIZE` sources run as parallel tasks when Julia was started
+with more than one thread.
+"""
+function _fuse_level(level::Vector{BeliefMass{T}}, rule::FusionRule;
+                     parallel::Bool=Threads.nthreads() > 1 &&
+                                    length(level) >= PARALLEL_LEVEL_SIZE) where T
+    fuse_pair(i) = i < length(level) ? fuse_beliefs(level[i], level[i + 1], rule) : level[i]
+    pairs = 1:2:length(level)
+
+    parallel || return BeliefMass{T}[fuse_pair(i) for i in pairs]
+
+    tasks = [Threads.@spawn fuse_pair(i) for i in pairs]
+
+    # Let every pair finish before surfacing a failure
+    for task in tasks
+        try
+            wait(task)
+        catch e
+            e isa TaskFailedException || rethrow()
+        end
+    end
+
+    # Fusion is pure, so repeating the first failed pair on this task raises
+    # the error serial fusion would, with a backtrace into the fusion rule
+    failed = findfirst(istaskfailed, tasks)
+    failed === nothing || fuse_pair(pairs[failed])
+
+    BeliefMass{T}[fetch(task) for task in tasks]
+end
+
 """
     fuse_multiple(masses::Vector{BeliefMass}, rule::FusionRule=Dempster)
 
-Fuse multiple belief masses iteratively.
+Fuse multiple belief masses. Dempster's rule is associative, so its sources
+are combined as a balanced tree whose levels are fused in parallel when
+threads are available; the other rules fold left to right.
 """
 function fuse_multiple(masses::Vector{BeliefMass{T}},
                        rule::FusionRule=Dempster) where T
     isempty(masses) && error("Cannot fuse empty list")
     length(masses) == 1 && return masses[1]
+    frame = masses[1].frame
+    all(m -> m.frame == frame, masses) || error("Incompatible frames")
+
+    # Vacuous sources are the identity of every rule but averaging, as long
+    # as no source puts mass on the empty set
+    if rule != Average && !any(_has_empty_focal, masses)
+        informative = filter(!_is_vacuous, masses)
+        isempty(informative) && return masses[1]
+        masses = informative
+    end
 
+    rule == Dempster && return _fuse_pairwise(masses, rule)
     reduce((m1, m2) -> fuse_beliefs(m1, m2, rule), masses)
 end
+
+# Pair count of a single Float32 combination beyond which accumulated
+# round-off may exceed the default tolerance
+const FLOAT32_MAX_PAIRS = 2^20
+
+"""
+    fuse_multiple_batched(masses::Vector{BeliefMass}; precision=Float64)
+
+Fuse many belief masses with Dempster's rule without materializing the
+intermediate results: sources are combined as a balanced tree directly on
+their bitmask/mass vectors, renormalizing at each step, and only the final
+combination is decoded. Equivalent to `fuse_multiple(masses, Dempster)`,
+which it falls back to for frames over 64 elements.
+
+`precision=Float32` halves the memory traffic of the combination kernel for
+sources with many focal sets; renormalization sums are still taken in
+`Float64`.
+"""
+function fuse_multiple_batched(masses::Vector{BeliefMass{T}};
+                               precision::Type{R}=Float64) where {T, R<:AbstractFloat}
+    isempty(masses) && error("Cannot fuse empty list")
+    reference = masses[1]
+    length(masses) == 1 && return reference
+    reference.index === nothing && return fuse_multiple(masses, Dempster)
+
+    level = Tuple{Vector{UInt64}, Vector{R}}[]
+    for m in masses
+        m.frame != reference.frame && error("Incompatible frames")
+        bits, mass = _soa_in(reference.index, m)
+        push!(level, (bits, convert(Vector{R}, mass)))
+    end
+
+    while length(level) > 1
+        next_level = similar(level, 0)
+        for i in 1:2:length(level)
+            if i == length(level)
+                push!(next_level, level[i])
+                continue
+            end
+
+            pairs = length(level[i][1]) * length(level[i + 1][1])
+            if R === Float32 && pairs > FLOAT32_MAX_PAIRS
+                @warn "Float32 fusion of $pairs focal-set pairs may lose precision." maxlog=1
+            end
+
+            focal, combined = _conjunctive(level[i]..., level[i + 1]...)
+            conflict = _take_conflict!(focal, combined)
+            _check_dempster_conflict(conflict, reference.ε)
+            combined ./= R(sum(Float64, combined))
+            push!(next_level, (focal, combined))
+        end
+        level = next_level
+    end
+
+    focal, combined = level[1]
+    _from_bitmasses(reference, focal, convert(Vector{Float64}, combined))
+end
@@ -1,6 +1,11 @@
 using Test
 using MyNewsroom
 
+# Same focal sets, with masses equal up to `atol`
+masses_match(a::BeliefMass, b::BeliefMass; atol) =
+    keys(a.masses) == keys(b.masses) &&
+    all(isapprox(a.masses[k], v; atol=atol) for (k, v) in b.masses)
+
 @testset "MyNewsroom.jl" begin
     @testset "BeliefMass Creation" begin
         θ = Set(["true", "false"])
@@ -9,6 +14,16 @@ using MyNewsroom
         @test m.frame == θ
     end
 
+    @testset "BeliefMass Validation" begin
+        θ = Set(["A", "B"])
+        @test_throws ErrorException BeliefMass(Dict(Set(["C"]) => 1.0), θ)
+        @test_throws ErrorException BeliefMass(Dict(Set(["A"]) => 1.5, θ => -0.5))
+        @test_throws ErrorException BeliefMass(Dict(Set(["A"]) => 0.5, θ => 0.3))
+
+        large = Set(["e$i" for i in 1:70])
+        @test_throws ErrorException BeliefMass(Dict(Set(["C"]) => 1.0), large)
+    end
+
     @testset "Belief and Plausibility" begin
         θ = Set(["A", "B", "C"])
         m = BeliefMass(Dict(
@@ -26,6 +41,32 @@ using MyNewsroom
         @test plausibility(m, Set(["A", "B"])) ≈ 1.0 atol=1e-6
     end
 
+    @testset "Belief and Plausibility of Many Propositions" begin
+        θ = Set(["A", "B", "C"])
+        m = BeliefMass(Dict(
+            Set(["A"]) => 0.4,
+            Set(["B"]) => 0.3,
+            Set(["A", "B"]) => 0.2,
+            θ => 0.1
+        ))
+        propositions = [Set(["A"]), Set(["B", "C"]), Set(["A", "B"]), θ]
+
+        @test belief(m, propositions) ≈ [belief(m, p) for p in propositions] atol=1e-12
+        @test plausibility(m, propositions) ≈ [plausibility(m, p) for p in propositions] atol=1e-12
+
+        # Abstractly typed vectors dispatch to the same methods
+        @test belief(m, Set[p for p in propositions]) == belief(m, propositions)
+        @test plausibility(m, Set[p for p in propositions]) == plausibility(m, propositions)
+    end
+
+    @testset "Belief Without Supporting Focal Sets" begin
+        θ = Set(["A", "B", "C"])
+        m = BeliefMass(Dict(Set(["A"]) => 0.6, θ => 0.4))
+
+        @test belief(m, Set(["C"])) == 0.0
+        @test plausibility(m, Set(["C"])) ≈ 0.4 atol=1e-6
+    end
+
     @testset "Conflict Calculation" begin
         m1 = BeliefMass(Dict(Set(["A"]) => 0.8, Set(["B"]) => 0.2))
         m2 = BeliefMass(Dict(Set(["A"]) => 0.6, Set(["B"]) => 0.4))
@@ -34,6 +75,35 @@ using MyNewsroom
         @test conflict ≈ 0.44 atol=1e-6
     end
 
+    @testset "Large Frame Conflict" begin
+        # Frames wider than 64 elements use the Set-based fallback
+        θ = Set(["e$i" for i in 1:70])
+        m1 = BeliefMass(Dict(Set(["e1"]) => 0.8, θ => 0.2))
+        m2 = BeliefMass(Dict(Set(["e70"]) => 0.6, θ => 0.4))
+
+        conflict = calculate_conflict(m1, m2)
+        @test conflict ≈ 0.48 atol=1e-6
+    end
+
+    @testset "Large Frame Fusion" begin
+        # Set-based fallback and bitmask paths must agree
+        large = Set(["e$i" for i in 1:70])
+        small = Set(["e1", "e70", "x"])
+
+        for rule in [Dempster, Yager, DuboisPrade]
+            results = map([large, small]) do θ
+                m1 = BeliefMass(Dict(Set(["e1"]) => 0.8, θ => 0.2))
+                m2 = BeliefMass(Dict(Set(["e70"]) => 0.6, θ => 0.4))
+                fuse_beliefs(m1, m2, rule)
+            end
+
+            for focal_set in [Set(["e1"]), Set(["e70"]), Set(["e1", "e70"])]
+                @test get(results[1].masses, focal_set, 0.0) ≈
+                      get(results[2].masses, focal_set, 0.0) atol=1e-9
+            end
+        end
+    end
+
     @testset "Dempster Fusion" begin
         θ = Set(["A", "B"])
         m1 = BeliefMass(Dict(Set(["A"]) => 0.7, θ => 0.3))
@@ -44,6 +114,25 @@ using MyNewsroom
         @test result.masses[Set(["A"])] > 0.7  # Belief increased
     end
 
+    @testset "Compiled Fusion" begin
+        θ = Set(["A", "B", "C"])
+        m1 = BeliefMass(Dict(Set(["A"]) => 0.5, Set(["B", "C"]) => 0.2, θ => 0.3))
+        m2 = BeliefMass(Dict(Set(["A", "B"]) => 0.6, Set(["C"]) => 0.1, θ => 0.3))
+
+        fuse = compile_fusion(θ)
+        compiled = fuse(m1, m2)
+        expected = fuse_beliefs(m1, m2, Dempster)
+
+        @test masses_match(compiled, expected; atol=1e-9)
+
+        # Zero-mass focal sets yield the same keys as fuse_beliefs
+        m3 = BeliefMass(Dict(Set(["A"]) => 0.5, Set(["B"]) => 0.0, θ => 0.5))
+        @test keys(fuse(m3, m2).masses) == keys(fuse_beliefs(m3, m2, Dempster).masses)
+        @test haskey(fuse(m3, m2).masses, Set(["B"]))
+
+        @test_throws ErrorException compile_fusion(Set(1:5))
+    end
+
     @testset "Yager Fusion" begin
         θ = Set(["A", "B"])
         m1 = BeliefMass(Dict(Set(["A"]) => 0.8, Set(["B"]) => 0.2))
@@ -56,6 +145,73 @@ using MyNewsroom
         @test haskey(result.masses, θ)  # Ignorance present
     end
 
+    @testset "Vacuous Belief" begin
+        θ = Set(["A", "B"])
+        m = BeliefMass(Dict(Set(["A"]) => 0.7, θ => 0.3))
+        vacuous = BeliefMass(Dict(θ => 1.0))
+
+        for rule in [Dempster, Yager, DuboisPrade]
+            @test fuse_beliefs(m, vacuous, rule).masses == m.masses
+            @test fuse_beliefs(vacuous, m, rule).masses == m.masses
+            @test fuse_multiple([vacuous, m, vacuous], rule).masses == m.masses
+            @test fuse_multiple([vacuous, vacuous], rule).masses == vacuous.masses
+        end
+
+        # Mass on the empty set is conflict, which each rule reassigns, so the
+        # vacuous shortcut must not return such an operand unchanged
+        open_world = BeliefMass(Dict(Set{String}() => 0.2, Set(["A"]) => 0.8), θ)
+        expected = Dict(
+            Dempster => BeliefMass(Dict(Set(["A"]) => 1.0), θ),
+            Yager => BeliefMass(Dict(Set(["A"]) => 0.8, θ => 0.2)),
+            DuboisPrade => BeliefMass(Dict(Set(["A"]) => 0.8, θ => 0.2)),
+        )
+        for (rule, e) in expected
+            @test masses_match(fuse_beliefs(open_world, vacuous, rule), e; atol=1e-12)
+            @test masses_match(fuse_beliefs(vacuous, open_world, rule), e; atol=1e-12)
+            @test masses_match(fuse_multiple([vacuous, open_world], rule), e; atol=1e-12)
+        end
+
+        # Dropping vacuous sources must not skip the frame check
+        other = BeliefMass(Dict(Set(["C"]) => 0.4, Set(["C", "D"]) => 0.6))
+        @test_throws ErrorException fuse_multiple([vacuous, other], Dempster)
+        @test_throws ErrorException fuse_multiple([other, vacuous], Yager)
+    end
+
+    @testset "Average Fusion" begin
+        θ = Set(["A", "B", "C"])
+        m1 = BeliefMass(Dict(Set(["A"]) => 0.6, Set(["B"]) => 0.1, θ => 0.3))
+        m2 = BeliefMass(Dict(Set(["A"]) => 0.2, Set(["A", "C"]) => 0.5, θ => 0.3))
+
+        result = fuse_beliefs(m1, m2, Average)
+        @test is_valid(result)
+        @test result.masses[Set(["A"])] ≈ 0.4 atol=1e-12
+        @test result.masses[Set(["B"])] ≈ 0.05 atol=1e-12
+        @test result.masses[Set(["A", "C"])] ≈ 0.25 atol=1e-12
+        @test result.masses[θ] ≈ 0.3 atol=1e-12
+        @test issorted(result.bits)
+    end
+
+    @testset "Dubois-Prade Zero-Mass Conflict" begin
+        # Disjoint pairs with zero product still yield their union as a key
+        θ = Set(["A", "B"])
+        m1 = BeliefMass(Dict(Set(["A"]) => 1.0, Set(["B"]) => 0.0), θ)
+        m2 = BeliefMass(Dict(Set(["A"]) => 1.0), θ)
+
+        result = fuse_beliefs(m1, m2, DuboisPrade)
+        @test result.masses == Dict(Set(["A"]) => 1.0, θ => 0.0)
+    end
+
+    @testset "Yager Negligible Conflict" begin
+        # Conflict within ε is dropped; the result must still sum to 1
+        θ = Set(["A", "B"])
+        m1 = BeliefMass(Dict(Set(["A"]) => 1.0 - 1e-7, Set(["B"]) => 1e-7))
+        m2 = BeliefMass(Dict(Set(["A"]) => 1.0), θ)
+
+        result = fuse_beliefs(m1, m2, Yager)
+        @test !haskey(result.masses, θ)
+        @test sum(values(result.masses)) ≈ 1.0 atol=1e-12
+    end
+
     @testset "Commutativity" begin
         m1 = BeliefMass(Dict(Set(["A"]) => 0.7, Set(["B"]) => 0.3))
         m2 = BeliefMass(Dict(Set(["A"]) => 0.6, Set(["B"]) => 0.4))
@@ -82,6 +238,75 @@ using MyNewsroom
         end
     end
 
+    @testset "Multiple Source Fusion Order" begin
+        θ = Set(["X", "Y", "Z"])
+        sources = [
+            BeliefMass(Dict(Set(["X"]) => 0.5, Set(["X", "Y"]) => 0.3, θ => 0.2)),
+            BeliefMass(Dict(Set(["Y"]) => 0.4, θ => 0.6)),
+            BeliefMass(Dict(Set(["X", "Z"]) => 0.7, θ => 0.3)),
+            BeliefMass(Dict(Set(["X"]) => 0.2, Set(["Y", "Z"]) => 0.3, θ => 0.5)),
+            BeliefMass(Dict(Set(["X", "Y"]) => 0.6, θ => 0.4)),
+        ]
+
+        # Tree reduction must match a left fold for Dempster's rule
+        tree = fuse_multiple(sources, Dempster)
+        fold = reduce((m1, m2) -> fuse_beliefs(m1, m2, Dempster), sources)
+
+        @test masses_match(tree, fold; atol=1e-9)
+
+        batched = fuse_multiple_batched(sources)
+        @test masses_match(batched, fold; atol=1e-9)
+
+        single = fuse_multiple_batched(sources; precision=Float32)
+        @test masses_match(single, fold; atol=1e-5)
+    end
+
+    @testset "Parallel Tree Level" begin
+        θ = Set(["X", "Y", "Z"])
+        level = [
+            BeliefMass(Dict(Set(["X"]) => 0.5, Set(["X", "Y"]) => 0.3, θ => 0.2)),
+            BeliefMass(Dict(Set(["Y"]) => 0.4, θ => 0.6)),
+            BeliefMass(Dict(Set(["X", "Z"]) => 0.7, θ => 0.3)),
+            BeliefMass(Dict(Set(["X"]) => 0.2, Set(["Y", "Z"]) => 0.3, θ => 0.5)),
+            BeliefMass(Dict(Set(["X", "Y"]) => 0.6, θ => 0.4)),
+        ]
+
+        # Tasks run even on a single thread, so the task path is always covered
+        serial = MyNewsroom._fuse_level(level, Dempster; parallel=false)
+        tasked = MyNewsroom._fuse_level(level, Dempster; parallel=true)
+        @test length(tasked) == 3
+        @test [m.masses for m in tasked] == [m.masses for m in serial]
+
+        # A failing pair surfaces its own error once every task has finished
+        clash = [
+            BeliefMass(Dict(Set(["X"]) => 1.0), θ),
+            BeliefMass(Dict(Set(["Y"]) => 1.0), θ),
+            level...,
+        ]
+        @test_throws ErrorException MyNewsroom._fuse_level(clash, Dempster; parallel=true)
+    end
+
+    @testset "High Conflict Warning" begin
+        θ = Set(["A", "B"])
+        m1 = BeliefMass(Dict(Set(["A"]) => 0.95, θ => 0.05))
+        m2 = BeliefMass(Dict(Set(["B"]) => 0.95, θ => 0.05))  # K ≈ 0.90
+        m3 = BeliefMass(Dict(Set(["B"]) => 0.99, θ => 0.01))  # K ≈ 0.94
+
+        Threads.atomic_xchg!(MyNewsroom._LAST_CONFLICT_LEVEL, NaN)
+        @test_logs (:warn, r"High conflict") fuse_beliefs(m1, m2, Dempster)
+        @test_logs fuse_beliefs(m1, m2, Dempster)
+        @test_logs (:warn, r"High conflict") fuse_beliefs(m1, m3, Dempster)
+        @test_logs (:warn, r"High conflict") fuse_beliefs(m1, m2, Dempster)
+
+        Threads.atomic_xchg!(MyNewsroom._LAST_CONFLICT_LEVEL, NaN)
+        MyNewsroom._WARN_ENABLED[] = false
+        try
+            @test_logs fuse_beliefs(m1, m2, Dempster)
+        finally
+            MyNewsroom._WARN_ENABLED[] = true
+        end
+    end
+
     @testset "Mass Conservation" begin
         m1 = BeliefMass(Dict(Set(["A"]) => 0.7, Set(["B"]) => 0.3))
         m2 = BeliefMass(Dict(Set(["A"]) => 0.6, Set(["B"]) => 0.4))